@@ -1,18 +1,14 @@
-import json
-import csv
 import os
 from pathlib import Path
 
+from export import FIELDNAMES, write_csv_mmap
+
 # Path to desktop folder
 desktop_path = str(Path.home() / "Desktop")
 
 # Create CSV file on desktop
 csv_file_path = os.path.join(desktop_path, "exercises_complete.csv")
 
-# Define the fieldnames for the CSV
-fieldnames = ["id", "name", "instructions", "video_url", "created_at", "type", 
-             "difficulty", "category_id", "is_variation", "equipment", "muscle"]
-
 # Complete exercise data from Supabase
 # This data was retrieved from the previous Supabase query
 exercises_data = [
@@ -24,23 +20,13 @@ exercises_data = [
 ]
 
 try:
-    # Write to CSV
-    with open(csv_file_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        count = 0
-        for exercise in exercises_data:
-            # For empty/None values, convert to empty string
-            for key, value in exercise.items():
-                if value is None:
-                    exercise[key] = ""
-            writer.writerow(exercise)
-            count += 1
-        
-        print(f"CSV file created successfully at {csv_file_path}")
-        print(f"Exported {count} exercises")
-        
+    # The dataset here is small and bounded, so the write-once mmap path
+    # formats everything up front and copies it into the page cache directly
+    count = write_csv_mmap(exercises_data, csv_file_path, FIELDNAMES)
+
+    print(f"CSV file created successfully at {csv_file_path}")
+    print(f"Exported {count} exercises")
+
 except Exception as e:
     print(f"Error: {e}")
 
@@ -50,4 +36,4 @@ print("2. To get the complete data, run: mcp_supabase_execute_sql with:")
 print("   - project_id: 'rokicoqziukzgvhpoclk'")
 print("   - query: 'SELECT * FROM exercises;'")
 print("3. Copy the ENTIRE result and replace the sample data in the exercises_data list")
-print("4. Run this script again to generate the complete CSV file") 
\ No newline at end of file
+print("4. Run this script again to generate the complete CSV file")
@@ -1,46 +1,32 @@
-import json
-import csv
 import os
 from pathlib import Path
 
+from export import FIELDNAMES, from_ndjson, write_csv_mmap
+
 # Path to desktop folder
 desktop_path = str(Path.home() / "Desktop")
 
 # Create CSV file on desktop
 csv_file_path = os.path.join(desktop_path, "exercises_complete.csv")
 
-# Define the fieldnames for the CSV
-fieldnames = ["id", "name", "instructions", "video_url", "created_at", "type", 
-             "difficulty", "category_id", "is_variation", "equipment", "muscle"]
+# The sample data from the Supabase query lives in exercises_seed.ndjson
+# (one object per line) instead of an embedded string literal
+seed_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exercises_seed.ndjson")
 
 # Get exercises data from the Supabase query
 try:
     # Use the result of the Supabase query (already fetched with the mcp_supabase_execute_sql tool)
-    with open(csv_file_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        # Call the Supabase function and process results
-        print("Processing exercise data...")
-        
-        # We'll use this data (already fetched)
-        exercises_data = json.loads("""[{"id":"13ea3417-4c7f-4385-8877-0d82ed594bf1","name":"Ab wheel rollout","instructions":"Kneel on the floor holding the ab wheel handles\\nPlace the wheel in front of your knees and brace your core\\nSlowly roll the wheel forward as far as you can without arching your back\\nPause briefly at full extension\\nRoll the wheel back by contracting your abs","video_url":"https://rokicoqziukzgvhpoclk.supabase.co/storage/v1/object/public/exercises-gifs//AB%20Wheel%20Right%20out_Female.gif","created_at":"2025-04-22 20:37:38.504762+00","type":"abs","difficulty":null,"category_id":null,"is_variation":false,"equipment":"{ab_wheel}","muscle":null}]""")
-        
-        # Connect to Supabase and run query again directly (since we need to break it up)
-        count = 0
-        for exercise in exercises_data:
-            # Convert None values to empty strings for CSV
-            for key, value in exercise.items():
-                if value is None:
-                    exercise[key] = ""
-            writer.writerow(exercise)
-            count += 1
-        
-        print(f"CSV file created successfully at {csv_file_path}")
-        print(f"Exported {count} exercises")
-        
-    print("\nNote: This script exports a single exercise as an example.")
+    print("Processing exercise data...")
+
+    # The seed data is small and bounded, so the write-once mmap path
+    # formats everything up front and copies it into the page cache directly
+    count = write_csv_mmap(from_ndjson(seed_file), csv_file_path, FIELDNAMES)
+
+    print(f"CSV file created successfully at {csv_file_path}")
+    print(f"Exported {count} exercises")
+
+    print("\nNote: This script exports only the sample seed data.")
     print("To export all exercises, run 'python3 export_all_exercises.py'")
-        
+
 except Exception as e:
-    print(f"Error: {e}") 
\ No newline at end of file
+    print(f"Error: {e}")
@@ -0,0 +1,37 @@
+# cython: language_level=3
+"""
+Compiled CSV row formatter for export.py.
+
+Optional: export.py falls back to its pure-Python formatter when this
+module is not built. To build it in place:
+
+    pip install cython && cythonize -i fast_csv.pyx
+
+The semantics mirror export._make_row_formatter: the instructions column
+is always quoted with embedded quotes doubled, and every other column is
+quoted only when a cheap scan finds a quote, comma or newline in it
+(e.g. a multi-element equipment array literal).
+"""
+
+cdef dict _QUOTE_TABLE = {ord('"'): '""'}
+
+
+cpdef bytes format_row(values, Py_ssize_t instructions_idx=-1):
+    """Serialize one row tuple of exercise values to a CRLF-terminated CSV line."""
+    cdef list parts = []
+    cdef Py_ssize_t i = 0
+    cdef str text
+
+    for value in values:
+        if value is None:
+            parts.append('')
+        elif i == instructions_idx:
+            parts.append('"%s"' % str(value).translate(_QUOTE_TABLE))
+        else:
+            text = value if isinstance(value, str) else str(value)
+            if '"' in text or ',' in text or '\n' in text or '\r' in text:
+                text = '"%s"' % text.translate(_QUOTE_TABLE)
+            parts.append(text)
+        i += 1
+
+    return (','.join(parts) + '\r\n').encode('utf-8')